@@ -0,0 +1,5 @@
+# Generated by versioningit
+__version__ = "0.0.0"
+__build_date__ = "2026-10-15 22:09:24.544919+00:00"
+__git_commit__ = "286f9f4b254ee273069628f31db9a56d33e65390"
+__dirty__ = False
@@ -18,9 +18,9 @@ from typing_extensions import Self
 from websockets.asyncio.client import ClientConnection, connect
 
 try:
-    from prefect.client.iap_auth import IAPTokenManager
+    from prefect.client.iap_auth import get_token_manager
 except ImportError:
-    IAPTokenManager = None
+    get_token_manager = None
 from prefect.settings import PREFECT_API_IAP_ENABLED, get_current_settings
 
 
@@ -147,14 +147,14 @@ def websocket_connect(uri: str, **kwargs: Any) -> WebsocketProxyConnect:
     """Create a WebSocket connection with proxy and SSL support."""
 
     if PREFECT_API_IAP_ENABLED.value():
-        if IAPTokenManager is None:
+        if get_token_manager is None:
             raise ImportError(
                 "IAP authentication is not available. Please install the prefect (or prefect-client) package with the 'gcp-iap' extra."
             )
 
         kwargs["additional_headers"] = {
             **(kwargs.get("additional_headers", {}) or {}),
-            **IAPTokenManager().get_id_token_header(),
+            **get_token_manager().get_id_token_header(),
         }
 
     return WebsocketProxyConnect(uri, **kwargs)
@@ -1,65 +1,321 @@
 import asyncio
-import json
+import base64
+import hashlib
+import os
+import sys
 import threading
 import time
-from typing import AsyncGenerator, Generator, Optional
+from contextvars import copy_context
+from functools import lru_cache
+from logging import Logger
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Generator, Mapping, Optional
 
 import google.auth
-import google.auth.transport.requests
+import google.auth.exceptions
+import google.auth.transport
 import google.cloud.secretmanager as secretmanager
 import httpx
+import orjson
 from google.auth.credentials import Credentials as GoogleCredentials
 
+from prefect.logging import get_logger
 from prefect.settings import (
     PREFECT_API_IAP_AUTH_HEADER_NAME,
     PREFECT_API_IAP_CLIENT_ID_GCP_SECRET_VERSION,
     PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT,
+    PREFECT_HOME,
 )
 
+if sys.platform != "win32":
+    import fcntl
+
+logger: Logger = get_logger(__name__)
+
+# Fraction of the token lifetime after which a background refresh is started
+TOKEN_REFRESH_FRACTION = 0.5
+
+# How long to wait before retrying a background refresh that failed
+TOKEN_REFRESH_RETRY_SECONDS = 30
+
+# How long a client ID read from Secret Manager is reused by other processes
+CLIENT_ID_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Lifetime assumed for ID tokens whose expiry cannot be read from the token
+DEFAULT_TOKEN_LIFETIME_SECONDS = 3600
+
+# Cached tokens are treated as expired this long before they actually expire,
+# or halfway through their lifetime for tokens that live less than twice this
+TOKEN_EXPIRY_BUFFER_SECONDS = 300
+
+# Lifetime assumed for ID tokens whose `exp` has already passed by the local
+# clock, e.g. due to clock skew
+MIN_TOKEN_LIFETIME_SECONDS = 60
+
+
+def _get_expiry_buffer(lifetime: float) -> float:
+    """Get how long before it expires a token with `lifetime` is refreshed"""
+    return min(TOKEN_EXPIRY_BUFFER_SECONDS, lifetime / 2)
+
+
+GOOGLE_CLOUD_PLATFORM_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+
+
+@lru_cache
+def _get_default_credentials(scopes: tuple[str, ...]) -> GoogleCredentials:
+    """Resolve Application Default Credentials once per process for a set of scopes"""
+    credentials, _ = google.auth.default(scopes=list(scopes))
+    return credentials
+
+
+_token_http_client: Optional[httpx.Client] = None
+_token_http_client_lock = threading.Lock()
+
+
+def _get_token_http_client() -> httpx.Client:
+    """
+    Get the HTTP client used for all token requests in this process.
+
+    Refreshing credentials and calling `generateIdToken` both go to Google APIs,
+    so sharing one HTTP/2 client lets the second call reuse the connection
+    opened by the first. Only a couple of connections are ever needed since
+    token requests are serialized.
+    """
+    global _token_http_client
+    if _token_http_client is None:
+        with _token_http_client_lock:
+            if _token_http_client is None:
+                _token_http_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=2, keepalive_expiry=300
+                    ),
+                )
+    return _token_http_client
+
+
+class _HttpxResponse(google.auth.transport.Response):
+    """Adapts an `httpx.Response` to the `google-auth` transport interface"""
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+
+    @property
+    def status(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self._response.headers
+
+    @property
+    def data(self) -> bytes:
+        return self._response.content
+
+
+class _HttpxRequest(google.auth.transport.Request):
+    """`google-auth` transport that sends requests with an `httpx.Client`"""
+
+    def __init__(self, client: httpx.Client):
+        self._client = client
+
+    def __call__(
+        self,
+        url: str,
+        method: str = "GET",
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> _HttpxResponse:
+        try:
+            response = self._client.request(
+                method,
+                url,
+                content=body,
+                headers=headers,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        except httpx.RequestError as exc:
+            raise google.auth.exceptions.TransportError(exc) from exc
+        return _HttpxResponse(response)
+
+
+@lru_cache(maxsize=1)
+def _get_secret_manager_client() -> secretmanager.SecretManagerServiceClient:
+    """Get a Secret Manager client shared by all callers in this process"""
+    return secretmanager.SecretManagerServiceClient()
+
+
+def _client_id_cache_path(secret_version: str) -> Path:
+    """Get the path of the local client ID cache file for a secret version"""
+    digest = hashlib.blake2b(secret_version.encode(), digest_size=16).hexdigest()
+    return Path(PREFECT_HOME.value()) / "iap" / f"client_id_{digest}"
+
+
+def _read_cached_client_id(secret_version: str) -> Optional[str]:
+    """Read a client ID cached by a previous process, if it has not expired"""
+    path = _client_id_cache_path(secret_version)
+    try:
+        if time.time() - path.stat().st_mtime >= CLIENT_ID_CACHE_TTL_SECONDS:
+            return None
+        return path.read_text().strip() or None
+    except OSError:
+        return None
+
+
+def _write_cached_client_id(secret_version: str, client_id: str) -> None:
+    """Cache a client ID for other processes, replacing any existing entry"""
+    path = _client_id_cache_path(secret_version)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path.write_text(client_id)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.debug("Failed to cache IAP client ID at %s", path, exc_info=True)
+
+
+def _remove_cached_client_id(secret_version: str) -> None:
+    """Remove a cached client ID so that no process reuses it"""
+    path = _client_id_cache_path(secret_version)
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        logger.debug("Failed to remove cached IAP client ID at %s", path, exc_info=True)
+
+
+def _id_token_cache_path(service_account: str, audience: str) -> Path:
+    """Get the path of the ID token file shared by processes on this machine"""
+    digest = hashlib.sha256(f"{service_account}\n{audience}".encode()).hexdigest()
+    return Path(PREFECT_HOME.value()) / "iap" / f"id_token_{digest[:16]}.json"
+
+
+def _read_shared_id_token(path: Path) -> Optional[tuple[str, float, float]]:
+    """
+    Read an ID token shared by another process.
+
+    Returns:
+        tuple: (id_token, expiry, refresh_at), both on the `time.monotonic()`
+            clock. Past `refresh_at` the token should no longer be used.
+    """
+    try:
+        data = orjson.loads(path.read_bytes())
+        expiry = time.monotonic() + float(data["exp"]) - time.time()
+        lifetime = float(data["lifetime"])
+        return data["token"], expiry, expiry - _get_expiry_buffer(lifetime)
+    except (OSError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _write_shared_id_token(
+    path: Path, token: str, expiry: float, lifetime: float
+) -> None:
+    """
+    Share an ID token with other processes, replacing any existing token.
+
+    The token's full `lifetime` is stored so that readers apply the same expiry
+    buffer as the process that generated it.
+    """
+    exp = time.time() + expiry - time.monotonic()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as file:
+        file.write(orjson.dumps({"token": token, "exp": exp, "lifetime": lifetime}))
+    os.replace(tmp_path, path)
+
+
+def _get_token_exp(id_token: str) -> Optional[float]:
+    """
+    Read the `exp` claim, in seconds since the epoch, from an ID token.
+
+    The signature is not verified; the claim is only used to schedule refreshes.
+    """
+    try:
+        payload = id_token.split(".")[1]
+        claims = orjson.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _parse_client_id(secret_data: bytes) -> str:
+    """Extract the client ID from the raw payload of the client ID secret"""
+    secret_data = secret_data.strip()
+
+    # Most secrets hold the bare client ID, so only try JSON when it can match
+    if secret_data.startswith(b"{"):
+        try:
+            secret_json = orjson.loads(secret_data)
+            if isinstance(secret_json, dict) and "client_id" in secret_json:
+                return secret_json["client_id"]
+            elif isinstance(secret_json, dict) and "web" in secret_json:
+                return secret_json["web"]["client_id"]
+            elif isinstance(secret_json, dict) and "installed" in secret_json:
+                return secret_json["installed"]["client_id"]
+        except orjson.JSONDecodeError:
+            pass
+
+    # Assume it's just the client ID string
+    return secret_data.decode("UTF-8")
+
 
 class IAPTokenManager:
     """
-    Singleton that manages ID tokens for Google Cloud Identity-Aware Proxy (IAP).
+    Manages ID tokens for Google Cloud Identity-Aware Proxy (IAP).
+
+    Use `get_token_manager` to get the instance shared by the whole process.
 
     This class handles:
     - Getting access tokens using Application Default Credentials
     - Calling the Service Account Credentials API to generate ID tokens
     - Caching tokens and managing expiration
+    - Refreshing tokens in the background before they expire
     - Thread-safe operations for both sync and async usage
     """
 
-    _instance = None
-    _lock = threading.Lock()
-
-    def __new__(cls) -> "IAPTokenManager":
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = (
+        "_sync_lock",
+        "_cached_token",
+        "_cached_bearer",
+        "_header_dict",
+        "_token_expiry",
+        "_refresh_at",
+        "_refresh_deadline",
+        "_refresh_in_flight",
+        "_rejected_token",
+        "_credentials",
+        "_client_id",
+        "_default_audience",
+        "_iam_url",
+    )
 
     def __init__(self):
-        if hasattr(self, "_initialized"):
-            return
-
-        self._initialized = True
-        self._sync_lock = threading.RLock()
-        self._async_lock = asyncio.Lock()
+        self._sync_lock = threading.Lock()
         self._cached_token = None
+        self._cached_bearer = None
+        self._header_dict = None
         self._token_expiry = 0
+        self._refresh_at = 0
+        self._refresh_deadline = 0
+        self._refresh_in_flight = False
+        self._rejected_token: Optional[str] = None
         self._credentials = None
         self._client_id = None
+        self._default_audience: Optional[str] = None
+        self._iam_url: Optional[tuple[str, str]] = None
 
     def _get_application_credentials(self) -> GoogleCredentials:
         """Get Application Default Credentials"""
         if self._credentials is None:
-            self._credentials, _ = google.auth.default(
-                scopes=["https://www.googleapis.com/auth/cloud-platform"]
-            )
+            self._credentials = _get_default_credentials(GOOGLE_CLOUD_PLATFORM_SCOPES)
 
         # Refresh if needed
         if not self._credentials.valid:
-            self._credentials.refresh(google.auth.transport.requests.Request())
+            self._credentials.refresh(_HttpxRequest(_get_token_http_client()))
 
         return self._credentials
 
@@ -73,10 +329,10 @@ class IAPTokenManager:
         return self._client_id
 
     def _get_client_id_from_secret(self) -> str:
-        """Fetch client ID from Google Secret Manager"""
-        if self._client_id:
-            return self._client_id
-
+        """
+        Fetch client ID from Google Secret Manager, reusing the value cached by
+        another process when it is recent enough
+        """
         secret_version = PREFECT_API_IAP_CLIENT_ID_GCP_SECRET_VERSION.value()
         if not secret_version:
             raise ValueError(
@@ -84,69 +340,207 @@ class IAPTokenManager:
                 "full secret version path (e.g., 'projects/PROJECT/secrets/SECRET/versions/VERSION')"
             )
 
-        client = secretmanager.SecretManagerServiceClient()
+        client_id = _read_cached_client_id(secret_version)
+        if client_id:
+            return client_id
+
+        client = _get_secret_manager_client()
         response = client.access_secret_version(name=secret_version)
 
         # The secret should contain just the client ID or a JSON with client_id field
-        secret_data = response.payload.data.decode("UTF-8").strip()
+        client_id = _parse_client_id(response.payload.data)
 
-        try:
-            # Try parsing as JSON first
-            secret_json = json.loads(secret_data)
-            if isinstance(secret_json, dict) and "client_id" in secret_json:
-                return secret_json["client_id"]
-            elif isinstance(secret_json, dict) and "web" in secret_json:
-                return secret_json["web"]["client_id"]
-            elif isinstance(secret_json, dict) and "installed" in secret_json:
-                return secret_json["installed"]["client_id"]
-        except json.JSONDecodeError:
-            pass
+        _write_cached_client_id(secret_version, client_id)
+        return client_id
 
-        # Assume it's just the client ID string
-        return secret_data
+    def _get_id_token_url(self) -> str:
+        """Get the `generateIdToken` URL for the impersonated service account"""
+        service_account = PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT.value()
+        if not service_account:
+            raise ValueError(
+                "PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT must be set to the "
+                "email address of the service account to impersonate"
+            )
+
+        # The URL is reused until the service account setting changes. It is
+        # stored with its service account as one tuple so that the background
+        # refresh thread never reads a mismatched pair.
+        cached = self._iam_url
+        if cached is not None and cached[0] == service_account:
+            return cached[1]
+
+        url = f"https://iamcredentials.googleapis.com/v1/projects/-/serviceAccounts/{service_account}:generateIdToken"
+        self._iam_url = (service_account, url)
+        return url
 
     def _generate_id_token(self, audience: str) -> tuple[str, float]:
         """
         Generate an ID token using the Service Account Credentials API.
 
         Returns:
-            tuple: (id_token, expiry_timestamp)
+            tuple: (id_token, expiry), where expiry is on the `time.monotonic()`
+                clock
         """
-        service_account = PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT.value()
-        if not service_account:
-            raise ValueError(
-                "PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT must be set to the "
-                "email address of the service account to impersonate"
-            )
+        url = self._get_id_token_url()
 
         # Get access token for authentication
         credentials = self._get_application_credentials()
-        access_token = credentials.token
-
-        # Call the generateIdToken API
-        url = f"https://iamcredentials.googleapis.com/v1/projects/-/serviceAccounts/{service_account}:generateIdToken"
 
         headers = {
-            "Authorization": f"Bearer {access_token}",
+            "Authorization": f"Bearer {credentials.token}",
             "Content-Type": "application/json; charset=utf-8",
         }
-
         payload = {"audience": audience, "includeEmail": "true"}
 
-        response = httpx.post(url, headers=headers, json=payload)
+        response = _get_token_http_client().post(url, headers=headers, json=payload)
         response.raise_for_status()
 
         token_data = response.json()
         id_token = token_data["token"]
 
-        # Calculate expiry (ID tokens are valid for 1 hour)
-        expiry_timestamp = time.time() + 3600  # 1 hour from now
+        # Calculate expiry from the token's `exp` claim, falling back to the
+        # default 1 hour lifetime. The remaining lifetime is tracked on the
+        # monotonic clock to be immune to later system clock changes.
+        lifetime = float(DEFAULT_TOKEN_LIFETIME_SECONDS)
+        if (exp := _get_token_exp(id_token)) is not None:
+            lifetime = max(exp - time.time(), MIN_TOKEN_LIFETIME_SECONDS)
+        expiry = time.monotonic() + lifetime
+
+        return id_token, expiry
+
+    def _get_shared_id_token(
+        self,
+        audience: str,
+        min_expiry: float = 0,
+        rejected_token: Optional[str] = None,
+    ) -> tuple[str, float]:
+        """
+        Get an ID token from the file shared by processes on this machine, and
+        only generate a new one if the shared token is due to be refreshed,
+        expires before `min_expiry`, or is the `rejected_token` that the server
+        has already refused.
 
-        return id_token, expiry_timestamp
+        A shared file lock is held to read the token and an exclusive one to
+        replace it, so concurrent processes make a single `generateIdToken` call
+        between them. Where file locking is unavailable, or the file cannot be
+        used, the token is generated for this process alone.
+
+        Returns:
+            tuple: (id_token, expiry), where expiry is on the `time.monotonic()`
+                clock
+        """
+        service_account = PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT.value()
+        if sys.platform == "win32" or not service_account:
+            return self._generate_id_token(audience)
+
+        path = _id_token_cache_path(service_account, audience)
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            lock_fd = os.open(path.with_suffix(".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError:
+            logger.debug("Failed to open shared IAP token at %s", path, exc_info=True)
+            return self._generate_id_token(audience)
+
+        def read_usable_token() -> Optional[tuple[str, float]]:
+            shared = _read_shared_id_token(path)
+            if shared is None:
+                return None
+            token, expiry, refresh_at = shared
+            if (
+                refresh_at > time.monotonic()
+                and expiry > min_expiry
+                and token != rejected_token
+            ):
+                return token, expiry
+            return None
+
+        # Closing the file descriptor releases the lock
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_SH)
+            if (usable := read_usable_token()) is not None:
+                return usable
+
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            # Another process may have replaced the token while we waited
+            if (usable := read_usable_token()) is not None:
+                return usable
+
+            token, expiry = self._generate_id_token(audience)
+            try:
+                _write_shared_id_token(
+                    path, token, expiry, lifetime=expiry - time.monotonic()
+                )
+            except OSError:
+                logger.debug("Failed to share IAP token at %s", path, exc_info=True)
+            return token, expiry
+        finally:
+            os.close(lock_fd)
 
     def _is_token_expired(self) -> bool:
-        """Check if the cached token is expired (with 5 minute buffer)"""
-        return time.time() >= (self._token_expiry - 300)  # 5 minute buffer
+        """Check if the cached token is expired (with a buffer of up to 5 minutes)"""
+        return time.monotonic() >= self._refresh_at
+
+    def _set_token(self, token: str, expiry: float) -> None:
+        """
+        Store a newly generated token. Must be called while holding `_sync_lock`.
+
+        The token is written before its expiry thresholds so that lock-free
+        readers, which read the thresholds first, never pair a new threshold
+        with an old token.
+        """
+        issued_at = time.monotonic()
+        self._cached_token = token
+        self._cached_bearer = f"Bearer {token}"
+        self._header_dict = MappingProxyType(
+            {PREFECT_API_IAP_AUTH_HEADER_NAME.value(): self._cached_bearer}
+        )
+        self._token_expiry = expiry
+        self._refresh_at = expiry - _get_expiry_buffer(expiry - issued_at)
+        self._refresh_deadline = issued_at + TOKEN_REFRESH_FRACTION * (
+            expiry - issued_at
+        )
+
+    def _refresh_in_background(self, audience: str) -> None:
+        """
+        Generate a new token and swap it into the cache. Runs in a daemon thread
+        so callers keep using the still-valid cached token in the meantime.
+        """
+        try:
+            # Accept a token another process has already refreshed
+            token, expiry = self._get_shared_id_token(
+                audience,
+                min_expiry=self._token_expiry,
+                rejected_token=self._rejected_token,
+            )
+        except Exception:
+            # The cached token is still valid, so back off before trying again
+            # rather than calling IAM on every request during an outage. The
+            # synchronous path takes over once the token actually expires.
+            logger.debug("Background IAP token refresh failed", exc_info=True)
+            with self._sync_lock:
+                self._refresh_deadline = min(
+                    time.monotonic() + TOKEN_REFRESH_RETRY_SECONDS, self._refresh_at
+                )
+                self._refresh_in_flight = False
+        else:
+            with self._sync_lock:
+                self._set_token(token, expiry)
+                self._refresh_in_flight = False
+
+    def _refresh_in_background_if_due(self, audience: str) -> None:
+        """
+        Start a background refresh if the cached token has passed its refresh
+        deadline. Must be called while holding `_sync_lock`.
+        """
+        if time.monotonic() >= self._refresh_deadline and not self._refresh_in_flight:
+            self._refresh_in_flight = True
+            # Run in a copy of the caller's context so the refresh sees the
+            # same settings
+            threading.Thread(
+                target=copy_context().run,
+                args=(self._refresh_in_background, audience),
+                daemon=True,
+            ).start()
 
     def get_id_token(self, audience: Optional[str] = None) -> str:
         """
@@ -159,48 +553,143 @@ class IAPTokenManager:
         Returns:
             Valid ID token string
         """
+        # Lock-free fast path for a cached token that needs no refresh
+        now = time.monotonic()
+        if now < self._refresh_deadline and now < self._refresh_at:
+            cached_token = self._cached_token
+            if cached_token:
+                return cached_token
+
         with self._sync_lock:
             if audience is None:
-                audience = self.client_id
+                # The default audience only changes if the client ID is cleared
+                audience = self._default_audience
+                if audience is None:
+                    audience = self._default_audience = self.client_id
 
-            # Return cached token if still valid
+            # Return cached token if still valid, refreshing it in the background
+            # once it has passed the refresh deadline
             if self._cached_token and not self._is_token_expired():
+                self._refresh_in_background_if_due(audience)
                 return self._cached_token
 
-            # Generate new token
-            self._cached_token, self._token_expiry = self._generate_id_token(audience)
+            # Get a new token, shared with other processes
+            self._set_token(
+                *self._get_shared_id_token(
+                    audience, rejected_token=self._rejected_token
+                )
+            )
             return self._cached_token
 
     async def get_id_token_async(self, audience: Optional[str] = None) -> str:
         """
         Async version of get_id_token.
 
-        Note: The underlying operations are still synchronous (Google API calls),
-        but this method ensures thread safety in async contexts.
+        Cached tokens are returned without leaving the event loop. On a cache
+        miss `get_id_token` runs in a worker thread, so sync and async callers
+        are serialized by the same lock and only one token generation is in
+        flight at a time.
+        """
+        if audience is None:
+            audience = self._default_audience
+
+        # Check expiry before reading the token; see `_set_token`
+        if audience and not self._is_token_expired():
+            cached_token = self._cached_token
+            if cached_token:
+                # Skip the background refresh check rather than block the event
+                # loop if another caller is generating a token right now
+                if self._sync_lock.acquire(blocking=False):
+                    try:
+                        self._refresh_in_background_if_due(audience)
+                    finally:
+                        self._sync_lock.release()
+                return cached_token
+
+        return await asyncio.to_thread(self.get_id_token, audience)
+
+    def current_bearer(self, audience: Optional[str] = None) -> str:
         """
-        async with self._async_lock:
-            # Run the synchronous token operations in a thread pool
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.get_id_token, audience)
+        Get a valid ID token formatted as a `Bearer` authorization header value.
+
+        The header value is built once per token rather than once per request.
+        """
+        token = self.get_id_token(audience)
+        return self._cached_bearer or f"Bearer {token}"
+
+    async def current_bearer_async(self, audience: Optional[str] = None) -> str:
+        """Async version of current_bearer"""
+        token = await self.get_id_token_async(audience)
+        return self._cached_bearer or f"Bearer {token}"
 
     def clear_cached_token(self) -> None:
-        """Clear the cached token to force refresh on next request"""
+        """
+        Clear the cached token to force refresh on next request.
+
+        The cleared token is also skipped in the file shared with other
+        processes, so that a token the server has rejected is not reused.
+        """
         with self._sync_lock:
+            if self._cached_token:
+                self._rejected_token = self._cached_token
             self._cached_token = None
+            self._cached_bearer = None
+            self._header_dict = None
             self._token_expiry = 0
+            self._refresh_at = 0
+            self._refresh_deadline = 0
 
-    def get_id_token_header(self) -> dict[str, str]:
-        """Get the ID token header for IAP authentication"""
-        return {
-            f"{PREFECT_API_IAP_AUTH_HEADER_NAME}": f"Bearer {self.get_id_token()}",
-        }
+    def clear_cached_client_id(self) -> None:
+        """
+        Clear the client ID, including the copy cached for other processes, so
+        that it is read from the secret again on the next request.
+
+        Used when the server rejects even a fresh token, as happens once the
+        client ID in the secret has been rotated.
+        """
+        with self._sync_lock:
+            self._client_id = None
+            self._default_audience = None
+
+        if secret_version := PREFECT_API_IAP_CLIENT_ID_GCP_SECRET_VERSION.value():
+            _remove_cached_client_id(secret_version)
+
+        self.clear_cached_token()
+
+    def get_id_token_header(self) -> Mapping[str, str]:
+        """
+        Get the ID token header for IAP authentication.
+
+        The returned mapping is read-only and shared until the token changes.
+        """
+        bearer = self.current_bearer()
+        header_name = PREFECT_API_IAP_AUTH_HEADER_NAME.value()
+        header_dict = self._header_dict
+        # The header name may have changed since the token was set
+        if header_dict is not None and header_name in header_dict:
+            return header_dict
+        return MappingProxyType({header_name: bearer})
+
+
+_token_manager: Optional[IAPTokenManager] = None
+_token_manager_lock = threading.Lock()
+
+
+def get_token_manager() -> IAPTokenManager:
+    """Get the `IAPTokenManager` shared by the whole process"""
+    global _token_manager
+    if _token_manager is None:
+        with _token_manager_lock:
+            if _token_manager is None:
+                _token_manager = IAPTokenManager()
+    return _token_manager
 
 
 class IAPAuth(httpx.Auth):
     """
     Custom httpx authentication for Google Cloud Identity-Aware Proxy (IAP).
 
-    This auth class uses the IAPTokenManager singleton to get ID tokens
+    This auth class uses the shared IAPTokenManager to get ID tokens
     and handles the authentication flow for httpx requests.
     """
 
@@ -217,7 +706,7 @@ class IAPAuth(httpx.Auth):
         self.auth_header_name: str = (
             auth_header_name or PREFECT_API_IAP_AUTH_HEADER_NAME.value()
         )
-        self.token_manager: IAPTokenManager = IAPTokenManager()
+        self.token_manager: IAPTokenManager = get_token_manager()
 
     def sync_auth_flow(
         self, request: httpx.Request
@@ -231,8 +720,7 @@ class IAPAuth(httpx.Auth):
         3. Handling 401 responses by clearing cache and retrying
         """
         # Get ID token and add to headers
-        id_token = self.token_manager.get_id_token()
-        request.headers[self.auth_header_name] = f"Bearer {id_token}"
+        request.headers[self.auth_header_name] = self.token_manager.current_bearer()
 
         # Send the request
         response = yield request
@@ -242,11 +730,13 @@ class IAPAuth(httpx.Auth):
             self.token_manager.clear_cached_token()
 
             # Get fresh token and retry
-            fresh_token = self.token_manager.get_id_token()
-            request.headers[self.auth_header_name] = f"Bearer {fresh_token}"
+            request.headers[self.auth_header_name] = self.token_manager.current_bearer()
 
-            # Retry the request
-            yield request
+            # Retry the request, and re-read the client ID if even a fresh
+            # token is rejected
+            response = yield request
+            if response.status_code == 401:
+                self.token_manager.clear_cached_client_id()
 
     async def async_auth_flow(
         self, request: httpx.Request
@@ -258,8 +748,8 @@ class IAPAuth(httpx.Auth):
         execution to avoid blocking the async event loop.
         """
         # Get ID token and add to headers
-        id_token = await self.token_manager.get_id_token_async()
-        request.headers[self.auth_header_name] = f"Bearer {id_token}"
+        bearer = await self.token_manager.current_bearer_async()
+        request.headers[self.auth_header_name] = bearer
 
         # Send the request
         response = yield request
@@ -269,8 +759,11 @@ class IAPAuth(httpx.Auth):
             self.token_manager.clear_cached_token()
 
             # Get fresh token and retry
-            fresh_token = await self.token_manager.get_id_token_async()
-            request.headers[self.auth_header_name] = f"Bearer {fresh_token}"
-
-            # Retry the request
-            yield request
+            fresh_bearer = await self.token_manager.current_bearer_async()
+            request.headers[self.auth_header_name] = fresh_bearer
+
+            # Retry the request, and re-read the client ID if even a fresh
+            # token is rejected
+            response = yield request
+            if response.status_code == 401:
+                self.token_manager.clear_cached_client_id()
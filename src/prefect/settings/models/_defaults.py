@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -73,6 +74,11 @@ def default_logging_config_path(values: dict[str, Any]) -> Path:
     return home / "logging.yml"
 
 
+def default_ssl_cert_file() -> str | None:
+    """Default ssl_cert_file based on the SSL_CERT_FILE environment variable."""
+    return os.environ.get("SSL_CERT_FILE")
+
+
 def default_database_connection_url(settings: "Settings") -> SecretStr:
     value: str = f"sqlite+aiosqlite:///{settings.home}/prefect.db"
     if settings.server.database.driver == "postgresql+asyncpg":
@@ -1,4 +1,3 @@
-import os
 from typing import ClassVar, Optional
 
 from pydantic import Field, SecretStr
@@ -9,6 +8,8 @@ from prefect.settings.base import (
     build_settings_config,
 )
 
+from ._defaults import default_ssl_cert_file
+
 
 class IAPSettings(PrefectBaseSettings):
     """
@@ -58,7 +59,7 @@ class APISettings(PrefectBaseSettings):
         description="If `True`, disables SSL checking to allow insecure requests. Setting to False is recommended only during development. For example, when using self-signed certificates.",
     )
     ssl_cert_file: Optional[str] = Field(
-        default=os.environ.get("SSL_CERT_FILE"),
+        default_factory=default_ssl_cert_file,
         description="This configuration settings option specifies the path to an SSL certificate file.",
     )
     enable_http2: bool = Field(
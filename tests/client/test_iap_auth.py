@@ -0,0 +1,782 @@
+import asyncio
+import base64
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Generator
+from unittest.mock import MagicMock
+
+import google.auth.exceptions
+import httpx
+import pytest
+import respx
+
+import prefect.client.iap_auth
+from prefect.client.iap_auth import (
+    CLIENT_ID_CACHE_TTL_SECONDS,
+    TOKEN_REFRESH_RETRY_SECONDS,
+    IAPAuth,
+    IAPTokenManager,
+    _client_id_cache_path,
+    _get_default_credentials,
+    _get_token_exp,
+    _get_token_http_client,
+    _HttpxRequest,
+    _id_token_cache_path,
+    _write_shared_id_token,
+    get_token_manager,
+)
+from prefect.settings import (
+    PREFECT_API_IAP_AUTH_HEADER_NAME,
+    PREFECT_API_IAP_CLIENT_ID_GCP_SECRET_VERSION,
+    PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT,
+    PREFECT_HOME,
+    temporary_settings,
+)
+
+SECRET_VERSION = "projects/project/secrets/iap-client-id/versions/1"
+SERVICE_ACCOUNT = "iap-invoker@project.iam.gserviceaccount.com"
+GENERATE_ID_TOKEN_URL = (
+    "https://iamcredentials.googleapis.com/v1/projects/-/serviceAccounts/"
+    f"{SERVICE_ACCOUNT}:generateIdToken"
+)
+
+
+def make_jwt(claims: bytes) -> str:
+    payload = base64.urlsafe_b64encode(claims).rstrip(b"=").decode()
+    return f"eyJhbGciOiJSUzI1NiJ9.{payload}.signature"
+
+
+@pytest.fixture
+def token_manager(monkeypatch: pytest.MonkeyPatch) -> IAPTokenManager:
+    manager = IAPTokenManager()
+    manager._client_id = "test-client-id"
+    monkeypatch.setattr(prefect.client.iap_auth, "_token_manager", manager)
+    return manager
+
+
+@pytest.fixture
+def mock_secret_manager(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Generator[MagicMock, None, None]:
+    client = MagicMock()
+    client.access_secret_version.return_value.payload.data = b"secret-client-id\n"
+    monkeypatch.setattr(
+        prefect.client.iap_auth, "_get_secret_manager_client", lambda: client
+    )
+    with temporary_settings(
+        {
+            PREFECT_API_IAP_CLIENT_ID_GCP_SECRET_VERSION: SECRET_VERSION,
+            PREFECT_HOME: tmp_path,
+        }
+    ):
+        yield client
+
+
+@pytest.fixture
+def mock_iam(
+    token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Generator[respx.Route, None, None]:
+    monkeypatch.setattr(
+        IAPTokenManager,
+        "_get_application_credentials",
+        MagicMock(return_value=MagicMock(token="access-token")),
+    )
+    with temporary_settings(
+        {
+            PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT: SERVICE_ACCOUNT,
+            PREFECT_HOME: tmp_path,
+        }
+    ):
+        with respx.mock(assert_all_mocked=False) as respx_mock:
+            yield respx_mock.post(GENERATE_ID_TOKEN_URL).mock(
+                return_value=httpx.Response(200, json={"token": "iam-token"})
+            )
+
+
+def mock_token_generation(
+    manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+) -> MagicMock:
+    tokens = iter(f"token-{i}" for i in range(100))
+    generate = MagicMock(
+        side_effect=lambda audience: (next(tokens), time.monotonic() + 3600)
+    )
+    monkeypatch.setattr(IAPTokenManager, "_generate_id_token", generate)
+    return generate
+
+
+def wait_for_background_refresh(manager: IAPTokenManager) -> None:
+    deadline = time.time() + 5
+    while manager._refresh_in_flight and time.time() < deadline:
+        time.sleep(0.01)
+    assert not manager._refresh_in_flight
+
+
+class TestIAPTokenManager:
+    def test_generates_token_on_first_use(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        generate = mock_token_generation(token_manager, monkeypatch)
+
+        assert token_manager.get_id_token() == "token-0"
+        assert token_manager.get_id_token() == "token-0"
+        generate.assert_called_once_with("test-client-id")
+
+    def test_cached_token_is_returned_without_taking_the_lock(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        mock_token_generation(token_manager, monkeypatch)
+        token_manager.get_id_token()
+
+        results: list[str] = []
+        with token_manager._sync_lock:
+            caller = threading.Thread(
+                target=lambda: results.append(token_manager.get_id_token())
+            )
+            caller.start()
+            caller.join(5)
+
+        assert results == ["token-0"]
+
+    def test_default_audience_is_resolved_once(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        generate = mock_token_generation(token_manager, monkeypatch)
+        token_manager.get_id_token()
+        assert token_manager._default_audience == "test-client-id"
+
+        token_manager._client_id = None
+        token_manager.clear_cached_token()
+        token_manager.get_id_token()
+
+        generate.assert_called_with("test-client-id")
+
+    def test_explicit_audience_does_not_become_the_default(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        generate = mock_token_generation(token_manager, monkeypatch)
+        token_manager.get_id_token("explicit-audience")
+
+        generate.assert_called_once_with("explicit-audience")
+        assert token_manager._default_audience is None
+
+    def test_token_state_is_stored_in_slots(self, token_manager: IAPTokenManager):
+        assert not hasattr(token_manager, "__dict__")
+
+    def test_refreshes_in_background_after_refresh_deadline(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        generate = mock_token_generation(token_manager, monkeypatch)
+        assert token_manager.get_id_token() == "token-0"
+
+        token_manager._refresh_deadline = 0
+
+        # The still-valid cached token is returned while the refresh runs
+        assert token_manager.get_id_token() == "token-0"
+        wait_for_background_refresh(token_manager)
+
+        assert token_manager.get_id_token() == "token-1"
+        assert generate.call_count == 2
+
+    def test_starts_one_background_refresh_at_a_time(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        generate = mock_token_generation(token_manager, monkeypatch)
+        token_manager.get_id_token()
+
+        release = threading.Event()
+        original = generate.side_effect
+
+        def slow_generate(audience: str) -> tuple[str, float]:
+            release.wait(5)
+            return original(audience)
+
+        generate.side_effect = slow_generate
+        token_manager._refresh_deadline = 0
+
+        for _ in range(5):
+            assert token_manager.get_id_token() == "token-0"
+
+        release.set()
+        wait_for_background_refresh(token_manager)
+        assert generate.call_count == 2
+
+    def test_failed_background_refresh_keeps_cached_token(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        generate = mock_token_generation(token_manager, monkeypatch)
+        token_manager.get_id_token()
+
+        generate.side_effect = RuntimeError("IAM unavailable")
+        token_manager._refresh_deadline = 0
+
+        assert token_manager.get_id_token() == "token-0"
+        wait_for_background_refresh(token_manager)
+        assert token_manager.get_id_token() == "token-0"
+
+    def test_failed_background_refresh_backs_off(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        generate = mock_token_generation(token_manager, monkeypatch)
+        token_manager.get_id_token()
+
+        generate.side_effect = RuntimeError("IAM unavailable")
+        token_manager._refresh_deadline = 0
+
+        token_manager.get_id_token()
+        wait_for_background_refresh(token_manager)
+        for _ in range(5):
+            assert token_manager.get_id_token() == "token-0"
+
+        assert not token_manager._refresh_in_flight
+        assert generate.call_count == 2
+        assert token_manager._refresh_deadline == pytest.approx(
+            time.monotonic() + TOKEN_REFRESH_RETRY_SECONDS, abs=5
+        )
+
+    def test_expired_token_is_regenerated_synchronously(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        generate = mock_token_generation(token_manager, monkeypatch)
+        token_manager.get_id_token()
+
+        token_manager._refresh_at = 0
+
+        assert token_manager.get_id_token() == "token-1"
+        assert generate.call_count == 2
+        assert not token_manager._refresh_in_flight
+
+    async def test_async_generates_token_with_iam_api(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        assert await token_manager.get_id_token_async() == "iam-token"
+        assert await token_manager.get_id_token_async() == "iam-token"
+
+        assert mock_iam.call_count == 1
+        request = mock_iam.calls.last.request
+        assert request.headers["Authorization"] == "Bearer access-token"
+        assert request.read() == b'{"audience":"test-client-id","includeEmail":"true"}'
+
+    async def test_async_token_is_shared_with_sync_callers(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        assert await token_manager.get_id_token_async() == "iam-token"
+        assert token_manager.get_id_token() == "iam-token"
+        assert mock_iam.call_count == 1
+
+    def test_token_expiry_is_read_from_token(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        id_token = make_jwt(b'{"exp": %d}' % (time.time() + 600))
+        mock_iam.mock(return_value=httpx.Response(200, json={"token": id_token}))
+
+        assert token_manager.get_id_token() == id_token
+        assert token_manager._token_expiry == pytest.approx(
+            time.monotonic() + 600, abs=5
+        )
+
+    def test_short_lived_token_is_reused_until_halfway_to_expiry(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        id_token = make_jwt(b'{"exp": %d}' % (time.time() + 240))
+        mock_iam.mock(return_value=httpx.Response(200, json={"token": id_token}))
+
+        assert token_manager.get_id_token() == id_token
+        assert token_manager.get_id_token() == id_token
+        assert mock_iam.call_count == 1
+        assert token_manager._refresh_at == pytest.approx(time.monotonic() + 120, abs=5)
+
+    def test_token_lifetime_is_clamped_when_exp_has_passed(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        id_token = make_jwt(b'{"exp": %d}' % (time.time() - 600))
+        mock_iam.mock(return_value=httpx.Response(200, json={"token": id_token}))
+
+        assert token_manager.get_id_token() == id_token
+        assert token_manager.get_id_token() == id_token
+        assert mock_iam.call_count == 1
+        assert token_manager._token_expiry == pytest.approx(
+            time.monotonic() + 60, abs=5
+        )
+
+    def test_token_expiry_defaults_to_one_hour(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        assert token_manager.get_id_token() == "iam-token"
+        assert token_manager._token_expiry == pytest.approx(
+            time.monotonic() + 3600, abs=5
+        )
+
+    async def test_concurrent_sync_and_async_misses_generate_one_token(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        generate = mock_token_generation(token_manager, monkeypatch)
+        started = threading.Event()
+        release = threading.Event()
+        original = generate.side_effect
+
+        def slow_generate(audience: str) -> tuple[str, float]:
+            started.set()
+            release.wait(5)
+            return original(audience)
+
+        generate.side_effect = slow_generate
+
+        sync_caller = threading.Thread(target=token_manager.get_id_token)
+        sync_caller.start()
+        assert started.wait(5)
+
+        async_caller = asyncio.create_task(token_manager.get_id_token_async())
+        await asyncio.sleep(0.1)
+        release.set()
+
+        assert await async_caller == "token-0"
+        sync_caller.join(5)
+        generate.assert_called_once()
+
+    def test_id_token_header_is_shared_until_token_changes(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        mock_token_generation(token_manager, monkeypatch)
+
+        header = token_manager.get_id_token_header()
+        assert header == {"Authorization": "Bearer token-0"}
+        assert token_manager.get_id_token_header() is header
+        with pytest.raises(TypeError):
+            header["Authorization"] = "Bearer other"  # type: ignore[index]
+
+        token_manager.clear_cached_token()
+        assert token_manager.get_id_token_header() == {
+            "Authorization": "Bearer token-1"
+        }
+
+    def test_sync_generates_token_with_iam_api(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        assert token_manager.get_id_token() == "iam-token"
+        assert mock_iam.call_count == 1
+
+    def test_id_token_url_follows_service_account_setting(
+        self, token_manager: IAPTokenManager
+    ):
+        with temporary_settings(
+            {PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT: SERVICE_ACCOUNT}
+        ):
+            url = token_manager._get_id_token_url()
+            assert url == GENERATE_ID_TOKEN_URL
+            assert token_manager._get_id_token_url() is url
+
+        other = "other@project.iam.gserviceaccount.com"
+        with temporary_settings({PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT: other}):
+            assert token_manager._get_id_token_url() == (
+                "https://iamcredentials.googleapis.com/v1/projects/-/"
+                f"serviceAccounts/{other}:generateIdToken"
+            )
+
+    def test_missing_service_account_raises(self, token_manager: IAPTokenManager):
+        with temporary_settings({PREFECT_API_IAP_IMPERSONATE_SERVICE_ACCOUNT: None}):
+            with pytest.raises(ValueError, match="IMPERSONATE_SERVICE_ACCOUNT"):
+                token_manager.get_id_token()
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Tokens are only shared where flock is available"
+)
+class TestSharedIdToken:
+    def test_token_is_shared_with_other_processes(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        assert token_manager.get_id_token() == "iam-token"
+
+        other_process = IAPTokenManager()
+        other_process._client_id = "test-client-id"
+        assert other_process.get_id_token() == "iam-token"
+        assert mock_iam.call_count == 1
+
+    def test_shared_token_file_is_private(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        token_manager.get_id_token()
+
+        path = _id_token_cache_path(SERVICE_ACCOUNT, "test-client-id")
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_expired_shared_token_is_regenerated(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        path = _id_token_cache_path(SERVICE_ACCOUNT, "test-client-id")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_shared_id_token(
+            path, "shared-token", time.monotonic() + 60, lifetime=3600
+        )
+
+        assert token_manager.get_id_token() == "iam-token"
+        assert mock_iam.call_count == 1
+
+    def test_short_lived_token_is_shared_with_other_processes(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        id_token = make_jwt(b'{"exp": %d}' % (time.time() + 240))
+        mock_iam.mock(return_value=httpx.Response(200, json={"token": id_token}))
+
+        for _ in range(5):
+            other_process = IAPTokenManager()
+            other_process._client_id = "test-client-id"
+            assert other_process.get_id_token() == id_token
+
+        assert mock_iam.call_count == 1
+
+    def test_shared_token_past_its_refresh_point_is_regenerated(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        path = _id_token_cache_path(SERVICE_ACCOUNT, "test-client-id")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_shared_id_token(
+            path, "shared-token", time.monotonic() + 100, lifetime=240
+        )
+
+        assert token_manager.get_id_token() == "iam-token"
+        assert mock_iam.call_count == 1
+
+    def test_background_refresh_uses_newer_shared_token(
+        self, token_manager: IAPTokenManager, mock_iam: respx.Route
+    ):
+        assert token_manager.get_id_token() == "iam-token"
+
+        path = _id_token_cache_path(SERVICE_ACCOUNT, "test-client-id")
+        _write_shared_id_token(
+            path, "shared-token", time.monotonic() + 7200, lifetime=7200
+        )
+        token_manager._refresh_deadline = 0
+
+        assert token_manager.get_id_token() == "iam-token"
+        wait_for_background_refresh(token_manager)
+
+        assert token_manager.get_id_token() == "shared-token"
+        assert mock_iam.call_count == 1
+
+
+class TestGetTokenManager:
+    def test_returns_one_instance_per_process(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(prefect.client.iap_auth, "_token_manager", None)
+
+        manager = get_token_manager()
+        assert isinstance(manager, IAPTokenManager)
+        assert get_token_manager() is manager
+        assert IAPAuth().token_manager is manager
+
+
+class TestClientId:
+    @pytest.fixture
+    def token_manager(self) -> IAPTokenManager:
+        return IAPTokenManager()
+
+    def test_reads_client_id_from_secret(
+        self, token_manager: IAPTokenManager, mock_secret_manager: MagicMock
+    ):
+        assert token_manager.client_id == "secret-client-id"
+        assert token_manager.client_id == "secret-client-id"
+        mock_secret_manager.access_secret_version.assert_called_once_with(
+            name=SECRET_VERSION
+        )
+
+    @pytest.mark.parametrize(
+        "secret_data",
+        [
+            b'{"client_id": "json-client-id"}',
+            b'{"web": {"client_id": "json-client-id"}}',
+            b'{"installed": {"client_id": "json-client-id"}}',
+        ],
+    )
+    def test_reads_client_id_from_json_secret(
+        self,
+        token_manager: IAPTokenManager,
+        mock_secret_manager: MagicMock,
+        secret_data: bytes,
+    ):
+        mock_secret_manager.access_secret_version.return_value.payload.data = (
+            secret_data
+        )
+        assert token_manager.client_id == "json-client-id"
+
+    def test_secret_that_is_not_json_is_used_as_is(
+        self, token_manager: IAPTokenManager, mock_secret_manager: MagicMock
+    ):
+        mock_secret_manager.access_secret_version.return_value.payload.data = (
+            b"{not-json"
+        )
+        assert token_manager.client_id == "{not-json"
+
+    def test_client_id_is_cached_for_other_processes(
+        self, token_manager: IAPTokenManager, mock_secret_manager: MagicMock
+    ):
+        assert token_manager.client_id == "secret-client-id"
+        assert _client_id_cache_path(SECRET_VERSION).read_text() == "secret-client-id"
+
+        assert IAPTokenManager().client_id == "secret-client-id"
+        mock_secret_manager.access_secret_version.assert_called_once()
+
+    def test_expired_client_id_cache_is_ignored(
+        self, token_manager: IAPTokenManager, mock_secret_manager: MagicMock
+    ):
+        cache_path = _client_id_cache_path(SECRET_VERSION)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text("stale-client-id")
+        stale = time.time() - CLIENT_ID_CACHE_TTL_SECONDS - 1
+        os.utime(cache_path, (stale, stale))
+
+        assert token_manager.client_id == "secret-client-id"
+        mock_secret_manager.access_secret_version.assert_called_once()
+
+    def test_missing_secret_version_raises(self, token_manager: IAPTokenManager):
+        with temporary_settings({PREFECT_API_IAP_CLIENT_ID_GCP_SECRET_VERSION: None}):
+            with pytest.raises(ValueError, match="CLIENT_ID_GCP_SECRET_VERSION"):
+                token_manager.client_id
+
+    def test_clear_cached_client_id_removes_cache_for_other_processes(
+        self, token_manager: IAPTokenManager, mock_secret_manager: MagicMock
+    ):
+        assert token_manager.client_id == "secret-client-id"
+        mock_secret_manager.access_secret_version.return_value.payload.data = (
+            b"rotated-client-id"
+        )
+
+        token_manager.clear_cached_client_id()
+
+        assert not _client_id_cache_path(SECRET_VERSION).exists()
+        assert token_manager.client_id == "rotated-client-id"
+        assert IAPTokenManager().client_id == "rotated-client-id"
+
+
+class TestApplicationCredentials:
+    @pytest.fixture(autouse=True)
+    def clear_credentials_cache(self) -> Generator[None, None, None]:
+        _get_default_credentials.cache_clear()
+        yield
+        _get_default_credentials.cache_clear()
+
+    def test_credentials_are_resolved_once_per_process(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        credentials = MagicMock(valid=True)
+        default = MagicMock(return_value=(credentials, "project"))
+        monkeypatch.setattr("google.auth.default", default)
+
+        assert IAPTokenManager()._get_application_credentials() is credentials
+        assert IAPTokenManager()._get_application_credentials() is credentials
+
+        default.assert_called_once_with(
+            scopes=["https://www.googleapis.com/auth/cloud-platform"]
+        )
+        credentials.refresh.assert_not_called()
+
+    def test_invalid_credentials_are_refreshed(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        credentials = MagicMock(valid=False)
+        monkeypatch.setattr(
+            "google.auth.default", MagicMock(return_value=(credentials, "project"))
+        )
+
+        assert token_manager._get_application_credentials() is credentials
+        credentials.refresh.assert_called_once()
+        assert isinstance(credentials.refresh.call_args.args[0], _HttpxRequest)
+
+
+class TestHttpxRequest:
+    def test_token_http_client_is_shared(self):
+        client = _get_token_http_client()
+        assert _get_token_http_client() is client
+        assert not client.is_closed
+
+    def test_sends_request_with_shared_client(self):
+        with respx.mock as respx_mock:
+            route = respx_mock.post("https://oauth2.googleapis.com/token").mock(
+                return_value=httpx.Response(200, json={"access_token": "access-token"})
+            )
+            request = _HttpxRequest(_get_token_http_client())
+            response = request(
+                "https://oauth2.googleapis.com/token",
+                method="POST",
+                body=b"grant_type=refresh_token",
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+
+        assert response.status == 200
+        assert response.headers["Content-Type"] == "application/json"
+        assert response.data == b'{"access_token":"access-token"}'
+        assert route.calls.last.request.content == b"grant_type=refresh_token"
+
+    def test_wraps_transport_errors(self):
+        with respx.mock as respx_mock:
+            respx_mock.get("http://metadata.google.internal/").mock(
+                side_effect=httpx.ConnectError("unreachable")
+            )
+            request = _HttpxRequest(_get_token_http_client())
+            with pytest.raises(google.auth.exceptions.TransportError):
+                request("http://metadata.google.internal/")
+
+
+class TestIAPAuth:
+    @pytest.fixture
+    def generate(
+        self, token_manager: IAPTokenManager, monkeypatch: pytest.MonkeyPatch
+    ) -> MagicMock:
+        return mock_token_generation(token_manager, monkeypatch)
+
+    @staticmethod
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers["Authorization"] == "Bearer token-0":
+            return httpx.Response(401)
+        return httpx.Response(200, json=request.headers["Authorization"])
+
+    def test_sync_auth_flow_sets_bearer_header(self, generate: MagicMock):
+        with httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+            auth=IAPAuth(),
+        ) as client:
+            response = client.get("http://prefect.test/api/health")
+
+        assert response.request.headers["Authorization"] == "Bearer token-0"
+
+    def test_sync_auth_flow_retries_401_with_fresh_token(self, generate: MagicMock):
+        with httpx.Client(
+            transport=httpx.MockTransport(self.handler), auth=IAPAuth()
+        ) as client:
+            response = client.get("http://prefect.test/api/health")
+
+        assert response.status_code == 200
+        assert response.json() == "Bearer token-1"
+        assert generate.call_count == 2
+
+    async def test_async_auth_flow_retries_401_with_fresh_token(
+        self, generate: MagicMock
+    ):
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler), auth=IAPAuth()
+        ) as client:
+            response = await client.get("http://prefect.test/api/health")
+
+        assert response.status_code == 200
+        assert response.json() == "Bearer token-1"
+        assert generate.call_count == 2
+
+    @pytest.fixture
+    def rotating_iam(self, mock_iam: respx.Route) -> respx.Route:
+        mock_iam.side_effect = [
+            httpx.Response(200, json={"token": "token-0"}),
+            httpx.Response(200, json={"token": "token-1"}),
+        ]
+        return mock_iam
+
+    def test_sync_auth_flow_does_not_reuse_rejected_shared_token(
+        self, rotating_iam: respx.Route
+    ):
+        with httpx.Client(
+            transport=httpx.MockTransport(self.handler), auth=IAPAuth()
+        ) as client:
+            response = client.get("http://prefect.test/api/health")
+
+        assert response.status_code == 200
+        assert response.json() == "Bearer token-1"
+        assert rotating_iam.call_count == 2
+
+    async def test_async_auth_flow_does_not_reuse_rejected_shared_token(
+        self, rotating_iam: respx.Route
+    ):
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler), auth=IAPAuth()
+        ) as client:
+            response = await client.get("http://prefect.test/api/health")
+
+        assert response.status_code == 200
+        assert response.json() == "Bearer token-1"
+        assert rotating_iam.call_count == 2
+
+    def test_rejected_token_is_replaced_for_other_processes(
+        self, rotating_iam: respx.Route
+    ):
+        with httpx.Client(
+            transport=httpx.MockTransport(self.handler), auth=IAPAuth()
+        ) as client:
+            client.get("http://prefect.test/api/health")
+
+        other_process = IAPTokenManager()
+        other_process._client_id = "test-client-id"
+        assert other_process.get_id_token() == "token-1"
+        assert rotating_iam.call_count == 2
+
+    def test_persistent_401_rereads_rotated_client_id(
+        self,
+        token_manager: IAPTokenManager,
+        mock_secret_manager: MagicMock,
+        generate: MagicMock,
+    ):
+        token_manager._client_id = None
+        with httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(401)),
+            auth=IAPAuth(),
+        ) as client:
+            response = client.get("http://prefect.test/api/health")
+
+        assert response.status_code == 401
+        assert generate.call_count == 2
+        generate.assert_called_with("secret-client-id")
+        assert not _client_id_cache_path(SECRET_VERSION).exists()
+
+        mock_secret_manager.access_secret_version.return_value.payload.data = (
+            b"rotated-client-id"
+        )
+        assert token_manager.get_id_token() == "token-2"
+        generate.assert_called_with("rotated-client-id")
+
+    def test_custom_auth_header_name(self, generate: MagicMock):
+        with httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+            auth=IAPAuth(auth_header_name="Proxy-Authorization"),
+        ) as client:
+            response = client.get("http://prefect.test/api/health")
+
+        assert response.request.headers["Proxy-Authorization"] == "Bearer token-0"
+        assert "Authorization" not in response.request.headers
+
+    def test_default_auth_header_name_is_read_from_settings(self):
+        assert IAPAuth().auth_header_name == "Authorization"
+        with temporary_settings(
+            {PREFECT_API_IAP_AUTH_HEADER_NAME: "Proxy-Authorization"}
+        ):
+            assert IAPAuth().auth_header_name == "Proxy-Authorization"
+        assert IAPAuth().auth_header_name == "Authorization"
+
+    def test_id_token_header_follows_header_name_setting(self, generate: MagicMock):
+        manager = get_token_manager()
+        assert dict(manager.get_id_token_header()) == {
+            "Authorization": "Bearer token-0"
+        }
+        with temporary_settings(
+            {PREFECT_API_IAP_AUTH_HEADER_NAME: "Proxy-Authorization"}
+        ):
+            assert dict(manager.get_id_token_header()) == {
+                "Proxy-Authorization": "Bearer token-0"
+            }
+        assert generate.call_count == 1
+
+
+class TestGetTokenExp:
+    def test_reads_exp_claim(self):
+        assert _get_token_exp(make_jwt(b'{"exp": 1700000000}')) == 1700000000
+
+    @pytest.mark.parametrize(
+        "id_token",
+        [
+            "not-a-jwt",
+            make_jwt(b"not json"),
+            make_jwt(b'{"iat": 1700000000}'),
+            make_jwt(b'["exp"]'),
+            "header.!!!.signature",
+        ],
+    )
+    def test_returns_none_for_unreadable_tokens(self, id_token: str):
+        assert _get_token_exp(id_token) is None
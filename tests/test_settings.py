@@ -626,6 +626,17 @@ class TestSettingsClass:
         new_settings = Settings()
         assert PREFECT_TEST_MODE.value_from(new_settings) is False
 
+    def test_ssl_cert_file_default_reads_environment_at_instantiation(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.delenv("PREFECT_API_SSL_CERT_FILE", raising=False)
+
+        monkeypatch.setenv("SSL_CERT_FILE", "/path/to/first.pem")
+        assert Settings().api.ssl_cert_file == "/path/to/first.pem"
+
+        monkeypatch.setenv("SSL_CERT_FILE", "/path/to/second.pem")
+        assert Settings().api.ssl_cert_file == "/path/to/second.pem"
+
     @pytest.mark.usefixtures("disable_hosted_api_server")
     def test_settings_to_environment_includes_all_settings_with_non_null_values(self):
         settings = Settings()